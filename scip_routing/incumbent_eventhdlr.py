@@ -0,0 +1,17 @@
+import pyscipopt as scip
+
+
+class IncumbentEventhdlr(scip.Eventhdlr):
+    def __init__(self, solver, callback, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.solver = solver
+        self.callback = callback
+
+    def eventinit(self):
+        self.model.catchEvent(scip.SCIP_EVENTTYPE.BESTSOLFOUND, self)
+
+    def eventexit(self):
+        self.model.dropEvent(scip.SCIP_EVENTTYPE.BESTSOLFOUND, self)
+
+    def eventexec(self, event):
+        self.callback(self.solver.result(self.model.getStatus()))
@@ -193,6 +193,30 @@ class Pricer(scip.Pricer):
     def is_feasible(self, demand, earliest_time, neighbor):
         return demand <= self.capacity and earliest_time <= self.latest[neighbor]
 
+    def is_feasible_path(self, path):
+        """
+        Checks whether a complete path (start depot, customers..., end depot) is elementary and respects the graph,
+        the capacity and the time windows of the current instance.
+        """
+        if path[0] != self.start_depot or path[-1] != self.end_depot:
+            return False
+        # customers visited more than once get a coefficient > 1 in the partitioning constraints
+        if len(set(path[1:-1])) != len(path) - 2:
+            return False
+        demand = 0
+        earliest_time = 0
+        for i, j in zip(path[:-1], path[1:]):
+            if not self.graph.has_edge(i, j):
+                return False
+            demand += self.demands[j]
+            earliest_time = max(earliest_time + self.time_fn(i, j), self.earliest[j])
+            if not self.is_feasible(demand, earliest_time, j):
+                return False
+        return True
+
+    def path_cost(self, path):
+        return sum(self.distance_fn(i, j) for i, j in zip(path[:-1], path[1:]))
+
     def expand_label(self, duals, label_to_expand, neighbor, next_node_to_expand):
         distance = self.distance_fn(next_node_to_expand, neighbor)
         redcost = label_to_expand.cost + (distance - duals[next_node_to_expand])
@@ -4,18 +4,40 @@ import pyscipopt as scip
 
 from scip_routing.edge_brancher import EdgeBrancher
 from scip_routing.edge_branching_eventhdlr import EdgeBranchingEventhdlr
+from scip_routing.incumbent_eventhdlr import IncumbentEventhdlr
 from scip_routing.pricing import Pricer
+from scip_routing.utils import save_column_pool, var_name_to_route
 
+EPSILON = 1e-6
 
-def solve_colgen(graph, instance, verbosity=0, distance_fn=None, pricing_strategy="rust"):
+
+def solve_colgen(graph, instance, verbosity=0, distance_fn=None, pricing_strategy="rust", column_pool=None):
     solver = VRPTWSolver(graph, instance, verbosity=verbosity, distance_fn=distance_fn,
-                         pricing_strategy=pricing_strategy)
+                         pricing_strategy=pricing_strategy, column_pool=column_pool)
     solver.solve()
     return solver.rmp
 
 
+class SolveResult:
+    """
+    Best solution known at some point of the solve. `status` is SCIP's status string, e.g. "optimal" or "timelimit",
+    and is "unknown" for incumbents reported while the solve is still running.
+    """
+
+    def __init__(self, routes, cost, bound, gap, status):
+        self.routes = routes
+        self.cost = cost
+        self.bound = bound
+        self.gap = gap
+        self.status = status
+
+    def __repr__(self):
+        return f"SolveResult(status={self.status}, cost={self.cost}, bound={self.bound}, gap={self.gap}, " \
+               f"routes={self.routes})"
+
+
 class VRPTWSolver:
-    def __init__(self, graph, instance, verbosity=0, distance_fn=None, pricing_strategy="rust"):
+    def __init__(self, graph, instance, verbosity=0, distance_fn=None, pricing_strategy="rust", column_pool=None):
         self.start_depot = instance.depot
         self.end_depot = instance.n_customers + 1
         self.customers = instance.customers
@@ -28,27 +50,52 @@ class VRPTWSolver:
                              strategy=pricing_strategy,
                              verbosity=verbosity)
         self.verbosity = verbosity
-        self.rmp = self.init_rmp()
+        self.rmp = self.init_rmp(column_pool or [])
         init_cons = list(self.rmp.getConss())
         self.pricer.set_init_cons(init_cons)
         self.rmp.includePricer(self.pricer, "LabelingPricer", "")
         self.obj = float("inf")
 
-    def init_rmp(self):
+    def init_rmp(self, column_pool):
         rmp = scip.Model()
+        vars_covering = defaultdict(lambda: [])
         for customer in self.customers:
             var_name = str((self.start_depot, customer, self.end_depot))
             cost = self.pricer.graph[self.start_depot][customer]["distance"] + \
                    self.pricer.graph[customer][self.end_depot]["distance"]
             var = rmp.addVar(obj=cost, name=var_name, vtype="B")
             self.added_paths[var_name] = var
-            rmp.addCons(var == 1, separate=False, modifiable=True)
+            vars_covering[customer].append(var)
+
+        # warm start with previously generated routes that are still feasible for this instance
+        for route in column_pool:
+            path = (self.start_depot, *route, self.end_depot)
+            var_name = str(path)
+            if var_name in self.added_paths or not self.pricer.is_feasible_path(path):
+                continue
+            var = rmp.addVar(obj=self.pricer.path_cost(path), name=var_name, vtype="B")
+            self.added_paths[var_name] = var
+            for customer in route:
+                vars_covering[customer].append(var)
+
+        for customer in self.customers:
+            rmp.addCons(scip.quicksum(vars_covering[customer]) == 1, separate=False, modifiable=True)
         rmp.setMinimize()
         if self.verbosity == 0:
             rmp.hideOutput()
         return rmp
 
-    def solve(self):
+    def solve(self, time_limit=None, node_limit=None, gap_limit=None, incumbent_callback=None):
+        """
+        Runs branch-and-price until optimality or until one of the limits is hit.
+
+        :param time_limit: time limit in seconds, checked by SCIP between pricing rounds, so it can be exceeded by
+            the duration of one pricing round
+        :param node_limit: maximum number of branch-and-bound nodes
+        :param gap_limit: relative gap at which to stop
+        :param incumbent_callback: called with a SolveResult every time a new best solution is found
+        :return: SolveResult with the best routes found, their cost, the dual bound, the gap and SCIP's status
+        """
         self.rmp.setHeuristics(scip.SCIP_PARAMSETTING.OFF)
         self.rmp.setPresolve(scip.SCIP_PARAMSETTING.OFF)
         self.rmp.setSeparating(scip.SCIP_PARAMSETTING.OFF)
@@ -64,11 +111,38 @@ class VRPTWSolver:
         self.rmp.setParam("display/freq", 1)
         self.rmp.setParam("display/headerfreq", 1)
         self.rmp.setObjIntegral()
+        if time_limit is not None:
+            self.rmp.setParam("limits/time", time_limit)
+        if node_limit is not None:
+            self.rmp.setParam("limits/nodes", node_limit)
+        if gap_limit is not None:
+            self.rmp.setParam("limits/gap", gap_limit)
+        if incumbent_callback is not None:
+            eventhdlr = IncumbentEventhdlr(self, incumbent_callback)
+            self.rmp.includeEventhdlr(eventhdlr, "Incumbent Event Handler", "")
+
         self.rmp.optimize()
-        if self.verbosity > 0:
+        if self.verbosity > 0 and self.rmp.getNSols() > 0:
             solution = self.rmp.getBestSol()
             print("Best solution found:")
             for var in self.rmp.getVars(transformed=True):
                 solval = solution[var]
-                if solval > 1e-6:
+                if solval > EPSILON:
                     print(var, var.getObj(), solval)
+        return self.result(self.rmp.getStatus())
+
+    def result(self, status):
+        routes = []
+        cost = float("inf")
+        if self.rmp.getNSols() > 0:
+            solution = self.rmp.getBestSol()
+            cost = self.rmp.getSolObjVal(solution)
+            for var in self.rmp.getVars(transformed=True):
+                route = var_name_to_route(var.name)
+                # the empty route covers no customer, so its value is arbitrary
+                if solution[var] > 0.5 and len(route) > 0:
+                    routes.append(route)
+        return SolveResult(routes, cost, self.rmp.getDualbound(), self.rmp.getGap(), status)
+
+    def save_column_pool(self, filename):
+        save_column_pool(self.added_paths.keys(), filename)
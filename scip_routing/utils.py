@@ -59,3 +59,32 @@ def var_name_to_edges(var_name):
     nodes = list(make_tuple(var_name))
     nodes[-1] = nodes[0]
     return set(zip(nodes[:-1], nodes[1:]))
+
+
+def var_name_to_route(var_name):
+    """
+    Returns the sequence of customers visited by the route of a path variable, i.e. the path without the depots.
+    """
+    var_name = var_name if var_name[0] != "t" else var_name[2:]
+    # columns priced by the rust pricer are named after a list, the others after a tuple
+    return tuple(make_tuple(var_name)[1:-1])
+
+
+def save_column_pool(var_names, filename):
+    """
+    Writes routes to a plain text file, one route per line as the space separated sequence of visited customers.
+    Depots are left out, so the pool can be reused on instances with a different number of customers.
+    The empty route and routes visiting a customer more than once are not written, as they can never be part of
+    a feasible solution.
+    """
+    with open(filename, "w") as f:
+        for var_name in var_names:
+            route = var_name_to_route(var_name)
+            if len(route) == 0 or len(set(route)) != len(route):
+                continue
+            f.write(" ".join(map(str, route)) + "\n")
+
+
+def load_column_pool(filename):
+    with open(filename) as f:
+        return [tuple(map(int, line.split())) for line in f if line.strip()]
@@ -2,7 +2,7 @@ import cvrplib
 
 from scip_routing.compact import solve_compact
 from scip_routing.solver import VRPTWSolver
-from scip_routing.utils import minify_instance, instance_graph
+from scip_routing.utils import minify_instance, instance_graph, load_column_pool, var_name_to_route
 
 
 def test_finds_optimal():
@@ -38,3 +38,142 @@ def test_same_answer_as_compact():
     obj_colgen = rust_solver.rmp.getObjVal()
     obj_compact = solve_compact(instance, graph, 10).getObjVal()
     assert obj_colgen == obj_compact
+
+
+def test_warm_start_from_column_pool(tmp_path):
+    instance, sol = cvrplib.download('R101', solution=True)
+    instance = minify_instance(instance, 10)
+    graph = instance_graph(instance)
+    solver = VRPTWSolver(graph=graph, instance=instance, pricing_strategy="py")
+    solver.solve()
+    pool_file = tmp_path / "pool.txt"
+    solver.save_column_pool(pool_file)
+
+    # the empty route (start depot, end depot) is not saved
+    saved_routes = {var_name_to_route(name) for name in solver.added_paths} - {()}
+    pool = load_column_pool(pool_file)
+    assert set(pool) == saved_routes
+
+    warm_solver = VRPTWSolver(graph=graph, instance=instance, pricing_strategy="py", column_pool=pool)
+    assert {var_name_to_route(name) for name in warm_solver.added_paths} == saved_routes
+    warm_solver.solve()
+    assert warm_solver.rmp.getObjVal() == solver.rmp.getObjVal()
+
+
+def test_column_pool_drops_routes_with_missing_nodes():
+    instance, sol = cvrplib.download('R101', solution=True)
+    small_instance = minify_instance(instance, 8)
+    small_graph = instance_graph(small_instance)
+    pool = [(1, 2), (3, 9), (9, 10), (5,)]
+    solver = VRPTWSolver(graph=small_graph, instance=small_instance, pricing_strategy="py", column_pool=pool)
+    for route in [(3, 9), (9, 10)]:
+        assert str((0, *route, 9)) not in solver.added_paths
+    solver.solve()
+    assert solver.rmp.getObjVal() == solve_compact(small_instance, small_graph, 8).getObjVal()
+
+
+def relaxed_instance(n_customers):
+    """
+    Small instance without time windows or capacity limits, so that any route is feasible until changed by a test.
+    """
+    instance, sol = cvrplib.download('R101', solution=True)
+    instance = minify_instance(instance, n_customers)
+    instance.earliest[:] = [0] * len(instance.earliest)
+    instance.latest[:] = [10 ** 6] * len(instance.latest)
+    instance.demands[:] = [0] + [1] * n_customers
+    instance.capacity = n_customers
+    return instance
+
+
+def warm_started_paths(instance, pool):
+    solver = VRPTWSolver(graph=instance_graph(instance), instance=instance, pricing_strategy="py",
+                         column_pool=pool)
+    return solver.added_paths
+
+
+def test_column_pool_drops_routes_violating_time_windows():
+    route_name = str((0, 1, 2, 6))
+    instance = relaxed_instance(5)
+    assert route_name in warm_started_paths(instance, [(1, 2)])
+
+    instance = relaxed_instance(5)
+    instance.latest[2] = 0
+    assert route_name not in warm_started_paths(instance, [(1, 2)])
+
+
+def test_column_pool_drops_routes_violating_capacity():
+    route_name = str((0, 1, 2, 6))
+    instance = relaxed_instance(5)
+    instance.demands[2] = instance.capacity
+    assert route_name not in warm_started_paths(instance, [(1, 2)])
+
+    instance = relaxed_instance(5)
+    instance.capacity = 1
+    assert route_name not in warm_started_paths(instance, [(1, 2)])
+
+
+def test_column_pool_drops_routes_with_repeated_customers():
+    instance = relaxed_instance(5)
+    assert str((0, 1, 2, 1, 6)) not in warm_started_paths(instance, [(1, 2, 1)])
+
+
+def test_column_pool_recomputes_costs():
+    instance = relaxed_instance(5)
+    graph = instance_graph(instance)
+    graph[1][2]["distance"] += 100
+    solver = VRPTWSolver(graph=graph, instance=instance, pricing_strategy="py", column_pool=[(1, 2)])
+    expected_cost = graph[0][1]["distance"] + graph[1][2]["distance"] + graph[2][6]["distance"]
+    assert solver.added_paths[str((0, 1, 2, 6))].getObj() == expected_cost
+
+
+def test_anytime_solve_reports_incumbents():
+    instance, sol = cvrplib.download('R101', solution=True)
+    instance = minify_instance(instance, 10)
+    graph = instance_graph(instance)
+    solver = VRPTWSolver(graph=graph, instance=instance, pricing_strategy="rust")
+    incumbents = []
+    result = solver.solve(time_limit=60, incumbent_callback=incumbents.append)
+
+    assert result.status == "optimal"
+    assert result.cost == solver.rmp.getObjVal() == incumbents[-1].cost
+    assert sorted(c for route in result.routes for c in route) == instance.customers
+    assert all(a.cost >= b.cost for a, b in zip(incumbents, incumbents[1:]))
+    assert all(isinstance(route, tuple) for route in result.routes)
+
+
+def test_solve_stops_at_node_limit():
+    instance, sol = cvrplib.download('R101', solution=True)
+    instance = minify_instance(instance, 50)
+    graph = instance_graph(instance)
+    solver = VRPTWSolver(graph=graph, instance=instance, pricing_strategy="rust")
+    result = solver.solve(node_limit=1)
+
+    assert result.status == "nodelimit"
+    assert -float("inf") < result.bound < float("inf")
+    if result.routes:
+        assert result.cost >= result.bound
+
+
+def test_solve_stops_at_time_limit():
+    instance, sol = cvrplib.download('R101', solution=True)
+    instance = minify_instance(instance, 50)
+    graph = instance_graph(instance)
+    solver = VRPTWSolver(graph=graph, instance=instance, pricing_strategy="rust")
+    result = solver.solve(time_limit=1)
+
+    assert result.status == "timelimit"
+    if result.routes:
+        assert result.cost >= result.bound
+
+
+def test_solve_stops_at_gap_limit():
+    instance, sol = cvrplib.download('R101', solution=True)
+    instance = minify_instance(instance, 50)
+    graph = instance_graph(instance)
+    solver = VRPTWSolver(graph=graph, instance=instance, pricing_strategy="rust")
+    gap_limit = 1.0
+    result = solver.solve(gap_limit=gap_limit)
+
+    assert result.status == "gaplimit"
+    assert result.gap <= gap_limit
+    assert result.bound <= result.cost < float("inf")